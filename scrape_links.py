@@ -5,10 +5,20 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
 import csv
+import email.utils
+import functools
+import gzip
+import hashlib
 import html as _html_mod
+import http.client
+import io
+import itertools
 import json
 import os
+import random
 import re
 import sys
 import tempfile
@@ -17,12 +27,13 @@ import time
 import urllib.error
 import urllib.parse
 import urllib.request
+import zlib
 from collections import deque
-from collections.abc import Callable, Iterable, Iterator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, TypeVar
 
 # --- Constants ------------------------------------------------------------------
 
@@ -42,8 +53,31 @@ RATE_LIMIT_REQUESTS_PER_MINUTE = 20
 RATE_LIMIT_WINDOW_SECONDS = 62.0
 RETRY_DELAY_SECONDS = 5.0
 RETRY_BACKOFF_MULTIPLIER = 2.0
+RETRY_JITTER_SECONDS = 0.5
+MAX_REDIRECTS = 5
+SCAN_CHUNK_SIZE = 64 * 1024
+# Longest match that may straddle a chunk edge and still be found intact
+_SCAN_OVERLAP = 4096
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_BATCH_DELAY = 5.0
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "yt-scraper"
+)
 
-_REDIRECT_URL_RE = re.compile(r"https://www\.youtube\.com/redirect[^\s)]+")
+_FAST_CHANNEL_RE = re.compile(
+    r"https?://(?:www\.)?youtube\.com/"
+    r"(channel/UC[A-Za-z0-9_-]{22}|@[A-Za-z0-9._-]{3,30}|c/[^/?#;]+|user/[A-Za-z0-9]{1,20})/?"
+)
+# Page scanning runs on raw response bytes; redirect URLs are percent-encoded
+# ASCII, so a match stops at whitespace, ")", a character that cannot appear
+# unescaped in a URL (", <, >), or the first non-ASCII byte. Stopping at quotes
+# keeps matches inside minified JSON short.
+_REDIRECT_URL_RE = re.compile(rb'https://www\.youtube\.com/redirect[^\s)"<>\x80-\xff]+')
+_REDIRECT_PARAM_RE = re.compile(r"[?&](q|event)=([^&#]*)")
+_INITIAL_DATA_URL_RE = re.compile(
+    rb'"url"\s*:\s*"(https://www\.youtube\.com/redirect(?:[^"\\]|\\.)*)"'
+)
 
 # --- Link categorisation --------------------------------------------------------
 
@@ -119,10 +153,18 @@ class SlidingWindowRateLimiter:
 
 # --- URL normalisation ----------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
 def normalise_channel_url(url: str, channel_id: Optional[str] = None) -> Optional[str]:
     if not url:
         return None
     url = url.strip()
+    # Fast path for the canonical shapes Takeout exports; anything else is parsed.
+    fast = _FAST_CHANNEL_RE.fullmatch(url)
+    if fast:
+        path = fast.group(1)
+        if channel_id and not path.startswith("channel/"):
+            return f"{YOUTUBE_ORIGIN}/channel/{channel_id.strip()}"
+        return f"{YOUTUBE_ORIGIN}/{path}"
     # Strip query and fragment before parsing
     parsed = urllib.parse.urlparse(url, scheme="https")
     if parsed.query:
@@ -176,6 +218,24 @@ def _normalise_column_name(name: str) -> str:
     return name.strip().lower().replace("_", " ")
 
 
+_TITLE_COLUMNS = ("channel title", "title")
+_URL_COLUMNS = ("channel url", "url")
+_ID_COLUMNS = ("channel id", "id")
+
+
+def _column_indices(header: list[str], names: tuple[str, ...]) -> tuple[int, ...]:
+    return tuple(i for i, column in enumerate(header) if column in names)
+
+
+def _first_value(row: list[str], indices: tuple[int, ...]) -> Optional[str]:
+    for i in indices:
+        if i < len(row):
+            value = row[i].strip()
+            if value:
+                return value
+    return None
+
+
 @dataclass(frozen=True, slots=True)
 class Subscription:
     title: str
@@ -204,34 +264,35 @@ class SubscriptionReader:
 
     def iter_subscriptions(self) -> Iterator[Subscription]:
         with self.path.open("r", encoding="utf-8-sig", newline="") as handle:
-            reader = csv.DictReader(handle)
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header is None:
+                return
+            # Resolve column positions once from the header instead of per row
+            columns = [_normalise_column_name(name) for name in header]
+            title_idx = _column_indices(columns, _TITLE_COLUMNS)
+            url_idx = _column_indices(columns, _URL_COLUMNS)
+            id_idx = _column_indices(columns, _ID_COLUMNS)
             for row in reader:
-                sub = self._row_to_subscription(row)
+                if not row:
+                    continue
+                sub = self._row_to_subscription(
+                    _first_value(row, title_idx),
+                    _first_value(row, url_idx),
+                    _first_value(row, id_idx),
+                )
                 if sub is not None:
                     yield sub
 
     def read(self) -> list[Subscription]:
         return list(self.iter_subscriptions())
 
-    def _row_to_subscription(self, row: dict[str, str]) -> Optional[Subscription]:
-        # Only normalise the columns we actually need
-        title = channel_url = channel_id = None
-        for k, v in row.items():
-            nk = _normalise_column_name(k)
-            val = (v or "").strip()
-            if not val:
-                continue
-            if nk in ("channel title", "title") and not title:
-                title = val
-            elif nk in ("channel url", "url") and not channel_url:
-                channel_url = val
-            elif nk in ("channel id", "id") and not channel_id:
-                channel_id = val
-            if title and channel_url and channel_id:
-                break
-
-        if channel_id and channel_id == "":
-            channel_id = None
+    def _row_to_subscription(
+        self,
+        title: Optional[str],
+        channel_url: Optional[str],
+        channel_id: Optional[str],
+    ) -> Optional[Subscription]:
         if not channel_url and channel_id:
             channel_url = f"{YOUTUBE_ORIGIN}/channel/{channel_id}"
         if not title:
@@ -247,53 +308,347 @@ class SubscriptionReader:
 
 # --- Page fetching --------------------------------------------------------------
 
-_FETCH_ERRORS = (urllib.error.URLError, OSError, TimeoutError)
+_T = TypeVar("_T")
 
+_FETCH_ERRORS = (urllib.error.URLError, OSError, TimeoutError, http.client.HTTPException)
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
 
-def fetch_about_page(
+
+def _uses_env_proxy(url: str) -> bool:
+    parts = urllib.parse.urlsplit(url)
+    proxies = urllib.request.getproxies()
+    return parts.scheme in proxies and not urllib.request.proxy_bypass(parts.hostname or "")
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections reused across requests, one set per thread.
+
+    urllib opens (and TLS-handshakes) a fresh connection for every request; keeping
+    one connection per host in each worker thread pays that cost once per worker.
+    Requests that must go through an environment-configured proxy still use urllib.
+    """
+
+    __slots__ = ("_local", "_lock", "_open", "_generation")
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open: list[http.client.HTTPConnection] = []
+        self._generation = 0
+
+    def _connection(self, scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+        connections = getattr(self._local, "connections", None)
+        if connections is None or self._local.generation != self._generation:
+            connections = self._local.connections = {}
+            self._local.generation = self._generation
+        conn = connections.get((scheme, netloc))
+        if conn is None:
+            factory = (
+                http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            )
+            conn = connections[(scheme, netloc)] = factory(netloc, timeout=timeout)
+            with self._lock:
+                self._open.append(conn)
+        elif conn.timeout != timeout:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+        return conn
+
+    def close(self) -> None:
+        """Close every connection opened by any thread; later requests reconnect."""
+        with self._lock:
+            connections, self._open = self._open, []
+            self._generation += 1
+        for conn in connections:
+            conn.close()
+
+    @staticmethod
+    def _send(
+        conn: http.client.HTTPConnection, path: str, headers: dict[str, str]
+    ) -> http.client.HTTPResponse:
+        try:
+            conn.request("GET", path, headers=headers)
+            return conn.getresponse()
+        except ConnectionError:
+            # The server may have dropped an idle keep-alive socket; retry once fresh.
+            conn.close()
+            conn.request("GET", path, headers=headers)
+            return conn.getresponse()
+
+    @contextlib.contextmanager
+    def open(self, url: str, *, headers: dict[str, str], timeout: float) -> Iterator[BinaryIO]:
+        """Yield a readable response for a GET, following redirects like urllib.
+
+        Raises urllib.error.HTTPError for any status of 300 or above that is not
+        followed, so callers can treat both transports the same way.
+        """
+        if _uses_env_proxy(url):
+            req = urllib.request.Request(url, headers=headers)
+            with _make_opener().open(req, timeout=timeout) as response:
+                yield response
+            return
+
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+            conn = self._connection(parts.scheme, parts.netloc, timeout)
+            try:
+                response = self._send(conn, path, headers)
+                location = response.getheader("Location")
+                if response.status in _REDIRECT_STATUSES and location:
+                    response.read()
+                    url = urllib.parse.urljoin(url, location)
+                    continue
+                if response.status >= 300:
+                    body = response.read()
+                    raise urllib.error.HTTPError(
+                        url, response.status, response.reason, response.msg, io.BytesIO(body)
+                    )
+            except BaseException:
+                conn.close()
+                raise
+            try:
+                yield response
+            finally:
+                if not response.isclosed():
+                    # A partially read body leaves the connection unusable.
+                    conn.close()
+            return
+        raise urllib.error.HTTPError(url, response.status, "Too many redirects", response.msg, None)
+
+
+_CONNECTION_POOL = ConnectionPool()
+
+
+def _retry_after_seconds(exc: urllib.error.HTTPError) -> float:
+    """Parse a Retry-After header given as seconds or an HTTP date; 0 if absent."""
+    value = exc.headers.get("Retry-After") if exc.headers is not None else None
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _backoff_delay(attempt: int, retry_after: float = 0.0) -> float:
+    backoff = RETRY_DELAY_SECONDS * (RETRY_BACKOFF_MULTIPLIER ** attempt)
+    return max(retry_after, backoff + random.uniform(0, RETRY_JITTER_SECONDS))
+
+
+# A truncated gzip stream raises EOFError and a corrupted one zlib.error
+_CACHE_READ_ERRORS = (OSError, EOFError, zlib.error)
+
+
+class PageCache:
+    """Gzip-compressed on-disk cache of fetched pages, keyed by request URL."""
+
+    __slots__ = ("_directory", "_ttl_seconds", "_hits", "_lock")
+
+    def __init__(self, directory: str | Path, ttl_seconds: float = DEFAULT_CACHE_TTL) -> None:
+        self._directory = Path(directory)
+        self._ttl_seconds = ttl_seconds
+        self._hits = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        """Number of pages served from the cache so far."""
+        return self._hits
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self._hits += 1
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self._directory / f"{digest}.html.gz"
+
+    def open(self, url: str) -> BinaryIO | None:
+        """Return a reader over the cached page, or None when missing or expired.
+
+        Expired entries are deleted so the cache directory does not grow forever.
+        """
+        path = self._path(url)
+        try:
+            if self._ttl_seconds > 0 and time.time() - path.stat().st_mtime > self._ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            return gzip.open(path, "rb")
+        except OSError:
+            return None
+
+    def discard(self, url: str) -> None:
+        """Remove a cached entry, e.g. one that failed to decompress."""
+        try:
+            self._path(url).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    @contextlib.contextmanager
+    def writer(self, url: str) -> Iterator[Callable[[bytes], None]]:
+        """Yield a chunk writer; the entry is committed only if the block completes.
+
+        Write failures are swallowed and simply skip the commit, since the cache
+        is best-effort and must not fail the fetch it is attached to.
+        """
+        tmp_name = None
+        gz_handle = None
+        ok = True
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            tmp_handle = tempfile.NamedTemporaryFile("wb", delete=False, dir=str(self._directory))
+            tmp_name = tmp_handle.name
+            gz_handle = gzip.GzipFile(fileobj=tmp_handle, mode="wb")
+        except OSError:
+            ok = False
+
+        def write(chunk: bytes) -> None:
+            nonlocal ok
+            if ok and gz_handle is not None:
+                try:
+                    gz_handle.write(chunk)
+                except OSError:
+                    ok = False
+
+        try:
+            yield write
+        except BaseException:
+            ok = False
+            raise
+        finally:
+            if gz_handle is not None:
+                try:
+                    gz_handle.close()
+                except OSError:
+                    ok = False
+            if tmp_name is not None:
+                try:
+                    tmp_handle.close()
+                    if ok:
+                        os.replace(tmp_name, self._path(url))
+                except OSError:
+                    ok = False
+            if not ok and tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+
+
+def _read_chunks(
+    handle: BinaryIO, sink: Callable[[bytes], None] | None = None
+) -> Iterator[bytes]:
+    while True:
+        chunk = handle.read(SCAN_CHUNK_SIZE)
+        if not chunk:
+            return
+        if sink is not None:
+            sink(chunk)
+        yield chunk
+
+
+def _fetch_with_retries(
     about_url: str,
+    consume: Callable[[Iterable[bytes]], _T],
     *,
-    timeout: int = DEFAULT_TIMEOUT,
-    use_proxy: bool = True,
-    rate_limiter: SlidingWindowRateLimiter | None = None,
-    max_retries: int = DEFAULT_RETRIES,
-) -> str:
-    """Return HTML or markdown-like text for the channel About page."""
+    timeout: int,
+    use_proxy: bool,
+    rate_limiter: SlidingWindowRateLimiter | None,
+    max_retries: int,
+    cache: PageCache | None,
+) -> _T:
+    """Feed the About page body to ``consume`` in chunks, retrying transient failures.
+
+    Cached pages are replayed from disk; fresh responses are written through to
+    the cache as they stream, so the whole page is never held in memory here.
+    """
     limiter = rate_limiter if use_proxy else None
     target = f"{PROXY_PREFIX}{about_url}" if use_proxy else about_url
-    req = urllib.request.Request(target, headers={"User-Agent": USER_AGENT})
-    opener = _make_opener()
+    if cache is not None:
+        cached = cache.open(target)
+        if cached is not None:
+            try:
+                with cached:
+                    result = consume(_read_chunks(cached))
+            except _CACHE_READ_ERRORS:
+                cache.discard(target)  # corrupt entry; fetch it again
+            else:
+                cache.record_hit()
+                return result
+    headers = {"User-Agent": USER_AGENT}
 
     for attempt in range(max_retries + 1):
         if limiter is not None:
             limiter.acquire()
             limiter.record(time.time())
         try:
-            with opener.open(req, timeout=timeout) as response:
-                return response.read().decode("utf-8", errors="replace")
+            with _CONNECTION_POOL.open(target, headers=headers, timeout=timeout) as response:
+                if cache is None:
+                    return consume(_read_chunks(response))
+                with cache.writer(target) as write:
+                    return consume(_read_chunks(response, write))
         except urllib.error.HTTPError as exc:
-            if exc.code == 429 and use_proxy:
-                delay = RETRY_DELAY_SECONDS * (RETRY_BACKOFF_MULTIPLIER ** attempt)
-                print(
-                    f"Received HTTP 429 when fetching {about_url}. "
-                    f"Retrying in {delay:.0f}s (attempt {attempt + 1}/{max_retries + 1})...",
-                    file=sys.stderr, flush=True,
-                )
-                time.sleep(delay)
-                continue
-            raise
+            if exc.code not in _RETRYABLE_STATUSES or attempt >= max_retries:
+                raise
+            delay = _backoff_delay(attempt, _retry_after_seconds(exc))
+            print(
+                f"Received HTTP {exc.code} when fetching {about_url}. "
+                f"Retrying in {delay:.0f}s (attempt {attempt + 1}/{max_retries + 1})...",
+                file=sys.stderr, flush=True,
+            )
+            time.sleep(delay)
         except _FETCH_ERRORS:
-            if attempt < max_retries:
-                delay = RETRY_DELAY_SECONDS * (RETRY_BACKOFF_MULTIPLIER ** attempt)
-                print(
-                    f"Transient error fetching {about_url}. "
-                    f"Retrying in {delay:.0f}s (attempt {attempt + 1}/{max_retries + 1})...",
-                    file=sys.stderr, flush=True,
-                )
-                time.sleep(delay)
-                continue
-            raise
-    return ""  # unreachable
+            if attempt >= max_retries:
+                raise
+            delay = _backoff_delay(attempt)
+            print(
+                f"Transient error fetching {about_url}. "
+                f"Retrying in {delay:.0f}s (attempt {attempt + 1}/{max_retries + 1})...",
+                file=sys.stderr, flush=True,
+            )
+            time.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+def fetch_about_page(
+    about_url: str,
+    *,
+    timeout: int = DEFAULT_TIMEOUT,
+    use_proxy: bool = True,
+    rate_limiter: SlidingWindowRateLimiter | None = None,
+    max_retries: int = DEFAULT_RETRIES,
+    cache: PageCache | None = None,
+) -> bytes:
+    """Return the raw HTML or markdown-like body of the channel About page.
+
+    The scraper itself streams pages through :func:`fetch_redirect_urls`; this is
+    kept as public API for callers that want the whole page.
+    """
+    return _fetch_with_retries(
+        about_url, b"".join, timeout=timeout, use_proxy=use_proxy,
+        rate_limiter=rate_limiter, max_retries=max_retries, cache=cache,
+    )
+
+
+def fetch_redirect_urls(
+    about_url: str,
+    *,
+    timeout: int = DEFAULT_TIMEOUT,
+    use_proxy: bool = True,
+    rate_limiter: SlidingWindowRateLimiter | None = None,
+    max_retries: int = DEFAULT_RETRIES,
+    cache: PageCache | None = None,
+) -> list[str]:
+    """Stream the About page and return its youtube.com/redirect URLs in page order."""
+    return _fetch_with_retries(
+        about_url, scan_redirect_urls, timeout=timeout, use_proxy=use_proxy,
+        rate_limiter=rate_limiter, max_retries=max_retries, cache=cache,
+    )
 
 
 # --- Link parsing ---------------------------------------------------------------
@@ -307,38 +662,104 @@ _EVENT_ORDER = {name: i for i, name in enumerate(_EVENT_PRIORITY)}
 _FALLBACK_ORDER = len(_EVENT_PRIORITY)
 
 
-def _iter_redirect_urls(page_text: str) -> Iterable[str]:
-    for m in _REDIRECT_URL_RE.finditer(page_text):
-        yield m.group(0)
-
+def scan_redirect_urls(chunks: Iterable[bytes]) -> list[str]:
+    """Collect redirect URLs from a page delivered as a stream of byte chunks.
 
-def parse_channel_links(page_text: str) -> list[str]:
-    """Decode youtube.com/redirect targets and order by on-page section priority."""
-    structured: list[tuple[str, str, int]] = []
-    for idx, raw_url in enumerate(_iter_redirect_urls(page_text)):
-        parsed = urllib.parse.urlparse(raw_url)
-        params = urllib.parse.parse_qs(parsed.query)
-        targets = params.get("q")
-        if not targets:
+    Direct youtube.com responses carry the About links only inside the embedded
+    ``ytInitialData`` JSON, where ``&`` is escaped and the plain-text scan cannot
+    split their query strings; those ``"url"`` tokens are preferred when present.
+    Each chunk is scanned as it arrives, carrying a short tail into the next one
+    so matches spanning a boundary are neither lost nor reported twice.
+    """
+    scans = (
+        (_INITIAL_DATA_URL_RE, 1, []),
+        (_REDIRECT_URL_RE, 0, []),
+    )
+    emitted_until = [0] * len(scans)  # absolute end of each pattern's last match
+    base = 0  # absolute offset of buffer[0]
+    buffer = bytearray()
+    for chunk in itertools.chain(chunks, (None,)):
+        final = chunk is None
+        if not final:
+            buffer += chunk
+            # Coalesce small reads so each scan covers at least a full chunk
+            if len(buffer) < SCAN_CHUNK_SIZE + _SCAN_OVERLAP:
+                continue
+        cut = len(buffer) if final else len(buffer) - _SCAN_OVERLAP
+        keep_from = cut
+        for i, (pattern, group, found) in enumerate(scans):
+            for match in pattern.finditer(buffer, max(emitted_until[i] - base, 0)):
+                if match.end() > cut:
+                    # May be truncated by the chunk edge; rescan with the next chunk.
+                    keep_from = min(keep_from, match.start())
+                    break
+                found.append(bytes(match.group(group)))
+                emitted_until[i] = base + match.end()
+        del buffer[:keep_from]
+        base += keep_from
+
+    json_tokens, plain_urls = scans[0][2], scans[1][2]
+    urls: list[str] = []
+    for token in json_tokens:
+        try:
+            urls.append(json.loads(b'"' + token + b'"'))
+        except json.JSONDecodeError:
             continue
-        dest = urllib.parse.unquote(targets[0])
-        event = params.get("event", [""])[0]
-        structured.append((event, dest, idx))
+    return urls or [raw.decode("ascii") for raw in plain_urls]
+
+
+def parse_redirect_urls(raw_urls: Iterable[str]) -> list[str]:
+    """Decode redirect targets and order them by on-page section priority."""
+    # One bucket per known section plus a fallback; appending in page order keeps
+    # each bucket stable, so concatenating them replaces a full sort. Buckets are
+    # insertion-ordered dicts so a target seen again in a higher-priority section
+    # can be moved there without a separate dedupe pass.
+    buckets: list[dict[str, None]] = [{} for _ in range(_FALLBACK_ORDER + 1)]
+    placed: dict[str, int] = {}
+    for raw_url in raw_urls:
+        # Pull q/event out in one scan; only the target needs percent-decoding.
+        target = event = None
+        for key, value in _REDIRECT_PARAM_RE.findall(raw_url):
+            if key == "q":
+                if target is None:
+                    target = value
+            elif event is None:
+                event = value
+        if not target:
+            continue
+        dest = urllib.parse.unquote_plus(target)
+        bucket = _EVENT_ORDER.get(event or "", _FALLBACK_ORDER)
+        current = placed.get(dest)
+        if current is not None:
+            if current <= bucket:
+                continue
+            del buckets[current][dest]
+        placed[dest] = bucket
+        buckets[bucket][dest] = None
 
-    structured.sort(key=lambda item: (_EVENT_ORDER.get(item[0], _FALLBACK_ORDER), item[2]))
+    return [dest for bucket in buckets for dest in bucket]
 
-    links: list[str] = []
-    seen: set[str] = set()
-    for _, dest, _ in structured:
-        if not dest or dest in seen:
-            continue
-        seen.add(dest)
-        links.append(dest)
-    return links
+
+def parse_channel_links(page: bytes | str) -> list[str]:
+    """Decode youtube.com/redirect targets in a page and order by section priority."""
+    if isinstance(page, str):
+        page = page.encode("utf-8")
+    return parse_redirect_urls(scan_redirect_urls((page,)))
 
 
 # --- Main scraping logic --------------------------------------------------------
 
+def _compile_url_filter(url_filters: list[str] | None) -> re.Pattern[str] | None:
+    """Fold substring filters into one alternation so each link is scanned once.
+
+    Matching is case-insensitive in the pattern itself, so links are searched
+    as-is rather than through a lowered copy.
+    """
+    if not url_filters:
+        return None
+    return re.compile("|".join(map(re.escape, url_filters)), re.IGNORECASE)
+
+
 def _scrape_one_channel(
     args: tuple[int, Subscription],
     *,
@@ -346,7 +767,8 @@ def _scrape_one_channel(
     use_proxy: bool,
     max_retries: int,
     rate_limiter: SlidingWindowRateLimiter | None,
-    url_filters: list[str] | None,
+    cache: PageCache | None,
+    url_filter: re.Pattern[str] | None,
     resume_from: set[str] | None,
     on_error: Callable[[str, str], None] | None,
     progress: bool,
@@ -369,19 +791,19 @@ def _scrape_one_channel(
         return (index, None, "Missing channel URL", None)
 
     try:
-        page_text = fetch_about_page(
+        raw_urls = fetch_redirect_urls(
             about_url, timeout=timeout, use_proxy=use_proxy,
-            rate_limiter=rate_limiter, max_retries=max_retries,
+            rate_limiter=rate_limiter, max_retries=max_retries, cache=cache,
         )
-    except (_FETCH_ERRORS, urllib.error.HTTPError) as exc:
+    except _FETCH_ERRORS as exc:
         err = f"HTTP {exc.code}" if isinstance(exc, urllib.error.HTTPError) else str(exc)
         if on_error:
             on_error(subscription.title, err)
         return (index, None, err, None)
 
-    links = parse_channel_links(page_text)
-    if url_filters:
-        links = [link for link in links if any(f in link.lower() for f in url_filters)]
+    links = parse_redirect_urls(raw_urls)
+    if url_filter is not None:
+        links = [link for link in links if url_filter.search(link)]
 
     categories = [categorise_link(link) for link in links]
     canonical_url = normalise_channel_url(subscription.url, subscription.channel_id)
@@ -401,6 +823,58 @@ def _scrape_one_channel(
     return (index, result, None, None)
 
 
+def _select_subscriptions(
+    subscriptions: Iterable[Subscription],
+    channel_filter: str | None,
+    limit: int | None,
+) -> list[Subscription]:
+    subscriptions_list = list(subscriptions)
+    if channel_filter:
+        lower_filter = channel_filter.lower()
+        subscriptions_list = [
+            s for s in subscriptions_list
+            if lower_filter in s.title.lower() or lower_filter in s.url.lower()
+        ]
+        if not subscriptions_list:
+            print(f"No channels matching '{channel_filter}'", file=sys.stderr)
+            return subscriptions_list
+
+    if limit is not None and limit > 0:
+        subscriptions_list = subscriptions_list[:limit]
+    return subscriptions_list
+
+
+def _print_summary(
+    scraped_count: int,
+    link_count: int,
+    total: int,
+    skipped_count: int,
+    error_count: int,
+    start_time: float,
+    cache_hits: int | None = None,
+) -> None:
+    elapsed = time.monotonic() - start_time
+    cached = f", {cache_hits} from cache" if cache_hits is not None else ""
+    print(f"\nScraped {scraped_count}/{total} channels{cached}, "
+          f"found {link_count} links total, "
+          f"skipped {skipped_count}, errors {error_count}, "
+          f"took {elapsed:.0f}s", flush=True)
+
+
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when it is installed, else None for the stdlib loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def _run_async(coro: Coroutine[object, object, _T]) -> _T:
+    with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+        return runner.run(coro)
+
+
 def scrape_links(
     subscriptions: Iterable[Subscription],
     *,
@@ -412,101 +886,127 @@ def scrape_links(
     use_proxy: bool = True,
     max_retries: int = DEFAULT_RETRIES,
     workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    batch_delay: float = DEFAULT_BATCH_DELAY,
     rate_limiter: SlidingWindowRateLimiter | None = None,
-    on_update: Callable[[list[dict[str, object]]], None] | None = None,
+    cache: PageCache | None = None,
+    on_update: Callable[[dict[str, object]], None] | None = None,
     on_error: Callable[[str, str], None] | None = None,
     resume_from: set[str] | None = None,
 ) -> list[dict[str, object]]:
-    results: list[dict[str, object]] = []
-    subscriptions_list = list(subscriptions)
-
-    if channel_filter:
-        lower_filter = channel_filter.lower()
-        subscriptions_list = [
-            s for s in subscriptions_list
-            if lower_filter in s.title.lower() or lower_filter in s.url.lower()
-        ]
-        if not subscriptions_list:
-            print(f"No channels matching '{channel_filter}'", file=sys.stderr)
-            return results
+    """Synchronous wrapper around :func:`scrape_links_async`."""
+    return _run_async(scrape_links_async(
+        subscriptions,
+        timeout=timeout, url_filters=url_filters, channel_filter=channel_filter,
+        limit=limit, progress=progress, use_proxy=use_proxy, max_retries=max_retries,
+        workers=workers, batch_size=batch_size, batch_delay=batch_delay,
+        rate_limiter=rate_limiter, cache=cache, on_update=on_update,
+        on_error=on_error, resume_from=resume_from,
+    ))
 
-    if limit is not None and limit > 0:
-        subscriptions_list = subscriptions_list[:limit]
 
+async def scrape_links_async(
+    subscriptions: Iterable[Subscription],
+    *,
+    timeout: int = DEFAULT_TIMEOUT,
+    url_filters: list[str] | None = None,
+    channel_filter: str | None = None,
+    limit: int | None = None,
+    progress: bool = True,
+    use_proxy: bool = True,
+    max_retries: int = DEFAULT_RETRIES,
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    batch_delay: float = DEFAULT_BATCH_DELAY,
+    rate_limiter: SlidingWindowRateLimiter | None = None,
+    cache: PageCache | None = None,
+    on_update: Callable[[dict[str, object]], None] | None = None,
+    on_error: Callable[[str, str], None] | None = None,
+    resume_from: set[str] | None = None,
+) -> list[dict[str, object]]:
+    """Scrape channels concurrently, keeping at most ``workers`` fetches in flight.
+
+    Network I/O runs on a dedicated thread pool sized to ``workers``; results are
+    collected on the event loop as each channel completes, so ``on_update`` is
+    never called concurrently and receives just the newest entry. Channels are
+    processed in groups of ``batch_size`` with a jittered pause of
+    ``batch_delay``-``2 * batch_delay`` seconds between groups instead of a fixed
+    sleep after every request; the pause is skipped after a group served entirely
+    from ``cache``.
+
+    Results land in a slot per subscription and are compacted once at the end, so
+    the returned list follows CSV order regardless of completion order.
+    """
+    subscriptions_list = _select_subscriptions(subscriptions, channel_filter, limit)
     total = len(subscriptions_list)
-    lowered_filters = [item.lower() for item in url_filters] if url_filters else None
-    skipped_count = 0
+    url_filter = _compile_url_filter(url_filters)
+    fetch_args = [
+        (index, sub) for index, sub in enumerate(subscriptions_list, start=1)
+        if resume_from is None or sub.title not in resume_from
+    ]
+    skipped_count = total - len(fetch_args)
     error_count = 0
+    link_count = 0
     start_time = time.monotonic()
-    results_lock = threading.Lock()
-
-    if workers <= 1:
-        try:
-            for index, subscription in enumerate(subscriptions_list, start=1):
-                _, result, error, _skip = _scrape_one_channel(
-                    (index, subscription),
-                    timeout=timeout, use_proxy=use_proxy, max_retries=max_retries,
-                    rate_limiter=rate_limiter, url_filters=lowered_filters,
-                    resume_from=resume_from, on_error=on_error,
-                    progress=progress, total=total,
-                )
-                if result is not None:
-                    with results_lock:
-                        results.append(result)
-                    if on_update is not None:
-                        on_update(list(results))
-                elif error:
-                    error_count += 1
-                elif _skip:
-                    skipped_count += 1
-        except KeyboardInterrupt:
-            if progress:
-                print("\nInterrupted, saving collected links...", flush=True)
-            return results
-    else:
-        # Parallel mode with semaphore for rate limit
-        sem = threading.Semaphore(max(1, workers))
-        limiter_for_sem = rate_limiter
-        fetch_args = [
-            (i + 1, sub) for i, sub in enumerate(subscriptions_list)
-            if resume_from is None or sub.title not in resume_from
-        ]
-        remaining = len(subscriptions_list) - len(fetch_args)
-        skipped_count = remaining
-
-        def _fetch_with_sem(item: tuple[int, Subscription]) -> tuple[int, dict | None, str | None, str | None]:
-            with sem:
-                return _scrape_one_channel(
-                    item, timeout=timeout, use_proxy=use_proxy, max_retries=max_retries,
-                    rate_limiter=limiter_for_sem, url_filters=lowered_filters,
-                    resume_from=None, on_error=on_error, progress=progress,
-                    total=total,
-                )
-
-        try:
-            with ThreadPoolExecutor(max_workers=workers) as executor:
-                futures = {executor.submit(_fetch_with_sem, item): item for item in fetch_args}
-                for future in as_completed(futures):
-                    _, result, error, _skip = future.result()
-                    if result is not None:
-                        with results_lock:
-                            results.append(result)
-                        if on_update is not None:
-                            on_update(list(results))
-                    elif error:
-                        error_count += 1
-        except KeyboardInterrupt:
-            if progress:
-                print("\nInterrupted, saving collected links...", flush=True)
-            return results
+    hits_before = cache.hits if cache is not None else 0
+    slots: list[dict[str, object] | None] = [None] * total
+
+    concurrency = max(1, workers)
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    async def bound_fetch(item: tuple[int, Subscription]) -> None:
+        nonlocal error_count, link_count
+        async with semaphore:
+            try:
+                index, result, error, _skip = await loop.run_in_executor(
+                    executor, functools.partial(
+                        _scrape_one_channel, item,
+                        timeout=timeout, use_proxy=use_proxy, max_retries=max_retries,
+                        rate_limiter=rate_limiter, cache=cache, url_filter=url_filter,
+                        resume_from=None, on_error=on_error, progress=progress, total=total,
+                    ))
+            except Exception as exc:
+                # One malformed page must not take down the rest of the batch.
+                error_count += 1
+                if on_error:
+                    on_error(item[1].title, str(exc) or type(exc).__name__)
+                return
+        if result is not None:
+            slots[index - 1] = result
+            link_count += len(result["links"])
+            if on_update is not None:
+                on_update(result)
+        elif error:
+            error_count += 1
+
+    step = batch_size if batch_size > 0 else max(1, len(fetch_args))
+    network_fetches = 0
+    try:
+        for offset in range(0, len(fetch_args), step):
+            # Only pause after a batch that actually hit the network
+            if network_fetches and batch_delay > 0:
+                await asyncio.sleep(random.uniform(batch_delay, batch_delay * 2))
+            batch = fetch_args[offset:offset + step]
+            batch_hits = cache.hits if cache is not None else 0
+            await asyncio.gather(*(bound_fetch(item) for item in batch))
+            network_fetches = len(batch)
+            if cache is not None:
+                network_fetches -= cache.hits - batch_hits
+    except asyncio.CancelledError:
+        if progress:
+            print("\nInterrupted, saving collected links...", flush=True)
+        return [result for result in slots if result is not None]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        _CONNECTION_POOL.close()
 
-    elapsed = time.monotonic() - start_time
+    results = [result for result in slots if result is not None]
     if progress and total > 0:
-        print(f"\nScraped {len(results)}/{total} channels, "
-              f"found {sum(len(r['links']) for r in results)} links total, "
-              f"skipped {skipped_count}, errors {error_count}, "
-              f"took {elapsed:.0f}s", flush=True)
-
+        cache_hits = cache.hits - hits_before if cache is not None else None
+        _print_summary(len(results), link_count, total, skipped_count, error_count, start_time,
+                       cache_hits)
     return results
 
 
@@ -755,17 +1255,74 @@ def generate_html(
 
 # --- Output formats -------------------------------------------------------------
 
+def _dumps(data: object) -> bytes:
+    # One dumps() + write beats json.dump(), which issues a write per encoder chunk.
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def _write_json(data: list[dict[str, object]], output_path: Path) -> None:
     output_dir = output_path.parent
     with tempfile.NamedTemporaryFile(
-        "w", encoding="utf-8", delete=False,
+        "wb", delete=False,
         dir=str(output_dir) if output_dir else None,
     ) as tmp_handle:
-        json.dump(data, tmp_handle, ensure_ascii=False, indent=2)
+        tmp_handle.write(_dumps(data))
         tmp_name = tmp_handle.name
     os.replace(tmp_name, output_path)
 
 
+class JsonlCheckpoint:
+    """Append-only JSONL file written with one O_APPEND write per entry.
+
+    Each line goes out in a single ``os.write`` on a descriptor opened once, with
+    no temp file, rename, or userspace buffering per update. Appends are not
+    locked: the scraper only calls ``append`` from the event loop thread.
+    """
+
+    __slots__ = ("_fd",)
+
+    def __init__(self, path: str | Path, *, truncate: bool = False) -> None:
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+        if truncate:
+            flags |= os.O_TRUNC
+        self._fd = os.open(path, flags, 0o644)
+
+    def append(self, entry: dict[str, object]) -> None:
+        self._write_all((json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8"))
+
+    def _write_all(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+    def __enter__(self) -> JsonlCheckpoint:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _read_jsonl(path: Path) -> list[dict[str, object]]:
+    """Load entries from a JSONL checkpoint, ignoring a torn trailing line."""
+    entries: list[dict[str, object]] = []
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(entry, dict) and "channel_title" in entry:
+                    entries.append(entry)
+    except OSError:
+        pass
+    return entries
+
+
 def _write_csv(data: list[dict[str, object]], output_path: Path) -> None:
     output_dir = output_path.parent
     with tempfile.NamedTemporaryFile(
@@ -802,6 +1359,11 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
                         help=f"Max retries for transient errors (default: {DEFAULT_RETRIES})")
     parser.add_argument("--workers", type=int, default=1,
                         help="Number of parallel workers for scraping (default: 1)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Channels per batch before pausing (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--batch-delay", type=float, default=DEFAULT_BATCH_DELAY,
+                        help="Base pause in seconds between batches, jittered up to 2x "
+                             f"(default: {DEFAULT_BATCH_DELAY:g})")
     parser.add_argument("--limit", type=int, default=None,
                         help="Only scrape the first N channels")
     parser.add_argument("--channel", dest="channel_filter", default=None,
@@ -820,13 +1382,25 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     parser.add_argument("--dry-run", action="store_true",
                         help="List channels that would be scraped without making requests")
     parser.add_argument("--resume", action="store_true",
-                        help="Skip channels already present in the output file")
+                        help="Continue an interrupted run from its checkpoint, or from the "
+                             "output file with --no-checkpoint")
     parser.add_argument("--no-progress", action="store_true",
                         help="Disable progress output")
     parser.add_argument("--no-proxy", action="store_true",
                         help="Fetch youtube.com directly instead of via r.jina.ai")
     parser.add_argument("--error-log", default=None,
                         help="Write fetch errors to a JSON file")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Cache About pages in this directory; setting this or --cache-ttl "
+                             f"enables the cache (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--cache-ttl", type=float, default=None,
+                        help="Seconds before a cached page is fetched again; 0 never expires "
+                             f"(default: {DEFAULT_CACHE_TTL})")
+    parser.add_argument("--jsonl-checkpoint", default=None,
+                        help="Append each scraped channel to this JSONL file as it completes "
+                             "(default: the output path with a .jsonl suffix)")
+    parser.add_argument("--no-checkpoint", action="store_true",
+                        help="Do not write or resume from a JSONL checkpoint")
     return parser.parse_args(argv)
 
 
@@ -866,16 +1440,29 @@ def main(argv: Optional[list[str]] = None) -> int:
         print(f"Unable to prepare output directory {output_path.parent}: {exc}", file=sys.stderr)
         return 1
 
-    # Resume: load already-scraped channel titles
-    resume_from: set[str] | None = None
-    if args.resume and output_path.exists():
-        try:
-            existing = json.loads(output_path.read_text(encoding="utf-8"))
-            resume_from = {item["channel_title"] for item in existing if "channel_title" in item}
-            if resume_from:
-                print(f"Resuming: {len(resume_from)} channel(s) already in output file")
-        except (json.JSONDecodeError, OSError):
-            pass
+    checkpoint_path: Path | None = None
+    if not args.no_checkpoint:
+        checkpoint_path = (Path(args.jsonl_checkpoint) if args.jsonl_checkpoint
+                           else output_path.with_suffix(".jsonl"))
+        if checkpoint_path == output_path:
+            checkpoint_path = output_path.with_suffix(".checkpoint.jsonl")
+
+    # Resume: recover channels finished by an interrupted run. A completed run
+    # deletes its checkpoint, so the next --resume scrapes everything afresh.
+    recovered: list[dict[str, object]] = []
+    if args.resume:
+        source = "checkpoint" if checkpoint_path is not None else "output file"
+        if checkpoint_path is not None:
+            recovered = _read_jsonl(checkpoint_path)
+        elif output_path.exists():
+            try:
+                recovered = json.loads(output_path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError):
+                pass
+        recovered = [entry for entry in recovered if "channel_title" in entry]
+        if recovered:
+            print(f"Resuming: {len(recovered)} channel(s) recovered from {source}")
+    resume_from = {str(entry["channel_title"]) for entry in recovered} or None
 
     # Error log collection
     error_entries: list[dict[str, str]] = []
@@ -889,28 +1476,48 @@ def main(argv: Optional[list[str]] = None) -> int:
     def write_results(data: list[dict[str, object]]) -> None:
         write_func(data, output_path)
 
-    if not args.resume or resume_from is None:
-        write_results([])
-
     rate_limiter = SlidingWindowRateLimiter(
         RATE_LIMIT_REQUESTS_PER_MINUTE, RATE_LIMIT_WINDOW_SECONDS
     ) if not args.no_proxy else None
 
-    results = scrape_links(
-        subscriptions,
-        timeout=args.timeout,
-        url_filters=args.filters,
-        channel_filter=args.channel_filter,
-        limit=args.limit,
-        progress=not args.no_progress,
-        use_proxy=not args.no_proxy,
-        max_retries=args.retries,
-        workers=args.workers,
-        rate_limiter=rate_limiter,
-        on_update=write_results if args.workers <= 1 else None,
-        on_error=on_error,
-        resume_from=resume_from,
-    )
+    cache: PageCache | None = None
+    if args.cache_dir is not None or args.cache_ttl is not None:
+        cache = PageCache(
+            args.cache_dir if args.cache_dir is not None else DEFAULT_CACHE_DIR,
+            args.cache_ttl if args.cache_ttl is not None else DEFAULT_CACHE_TTL,
+        )
+
+    checkpoint: JsonlCheckpoint | None = None
+    if checkpoint_path is not None:
+        try:
+            checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            checkpoint = JsonlCheckpoint(checkpoint_path, truncate=not args.resume)
+        except OSError as exc:
+            print(f"Unable to open checkpoint {checkpoint_path}: {exc}", file=sys.stderr)
+            return 1
+
+    selected = _select_subscriptions(subscriptions, args.channel_filter, args.limit)
+    try:
+        results = _run_async(scrape_links_async(
+            selected,
+            timeout=args.timeout,
+            url_filters=args.filters,
+            progress=not args.no_progress,
+            use_proxy=not args.no_proxy,
+            max_retries=args.retries,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            batch_delay=args.batch_delay,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            on_update=checkpoint.append if checkpoint is not None else None,
+            on_error=on_error,
+            resume_from=resume_from,
+        ))
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+    results = recovered + results
 
     # Sort results if requested
     if args.sort_order == "title":
@@ -943,6 +1550,16 @@ def main(argv: Optional[list[str]] = None) -> int:
     # Write main output
     write_results(results)
 
+    # Drop the checkpoint once every channel has a result or an error; after an
+    # interrupt it is kept so --resume can finish the remaining channels
+    finished = {str(entry["channel_title"]) for entry in results}
+    finished.update(entry["channel_title"] for entry in error_entries)
+    if checkpoint_path is not None and all(sub.title in finished for sub in selected):
+        try:
+            checkpoint_path.unlink(missing_ok=True)
+        except OSError as exc:
+            print(f"Failed to remove checkpoint {checkpoint_path}: {exc}", file=sys.stderr)
+
     # Generate HTML page
     if args.html or output_path.suffix.lower() == ".html":
         html_path = output_path.with_suffix(".html")
@@ -954,8 +1571,7 @@ def main(argv: Optional[list[str]] = None) -> int:
         error_path = Path(args.error_log)
         try:
             error_path.parent.mkdir(parents=True, exist_ok=True)
-            error_path.write_text(json.dumps(error_entries, indent=2, ensure_ascii=False),
-                                  encoding="utf-8")
+            error_path.write_bytes(_dumps(error_entries))
             print(f"Wrote {len(error_entries)} error(s) to {error_path.resolve()}")
         except OSError as exc:
             print(f"Failed to write error log: {exc}", file=sys.stderr)
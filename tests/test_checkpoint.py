@@ -0,0 +1,47 @@
+"""Tests for the JSONL checkpoint writer and reader."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import scrape_links
+
+
+class TestJsonlCheckpoint(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "checkpoint.jsonl"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_appends_entries_across_opens(self) -> None:
+        long_entry = {"channel_title": "Long", "links": ["https://x.example/" + "a" * 8000]}
+        with scrape_links.JsonlCheckpoint(self.path, truncate=True) as checkpoint:
+            checkpoint.append({"channel_title": "Ünïcode", "links": []})
+            checkpoint.append(long_entry)
+        with scrape_links.JsonlCheckpoint(self.path) as checkpoint:
+            checkpoint.append({"channel_title": "Third", "links": []})
+        entries = scrape_links._read_jsonl(self.path)
+        self.assertEqual([e["channel_title"] for e in entries], ["Ünïcode", "Long", "Third"])
+        self.assertEqual(entries[1], long_entry)
+
+    def test_truncate_discards_previous_run(self) -> None:
+        with scrape_links.JsonlCheckpoint(self.path) as checkpoint:
+            checkpoint.append({"channel_title": "Old", "links": []})
+        with scrape_links.JsonlCheckpoint(self.path, truncate=True) as checkpoint:
+            checkpoint.append({"channel_title": "New", "links": []})
+        self.assertEqual(
+            [e["channel_title"] for e in scrape_links._read_jsonl(self.path)], ["New"]
+        )
+
+    def test_reader_ignores_torn_trailing_line(self) -> None:
+        self.path.write_text('{"channel_title": "Done", "links": []}\n{"channel_ti', "utf-8")
+        entries = scrape_links._read_jsonl(self.path)
+        self.assertEqual([e["channel_title"] for e in entries], ["Done"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+"""Tests for About page fetching and retry behaviour."""
+
+from __future__ import annotations
+
+import contextlib
+import email.message
+import http.server
+import io
+import tempfile
+import threading
+import unittest
+import urllib.error
+from collections.abc import Iterator
+from pathlib import Path
+from unittest import mock
+
+import scrape_links
+
+
+def _http_error(code: int, retry_after: str | None = None) -> urllib.error.HTTPError:
+    headers = email.message.Message()
+    if retry_after is not None:
+        headers["Retry-After"] = retry_after
+    return urllib.error.HTTPError("https://example.com", code, "error", headers, None)
+
+
+class _FakePool:
+    def __init__(self, outcomes: list[object]) -> None:
+        self._outcomes = list(outcomes)
+        self.calls = 0
+
+    @contextlib.contextmanager
+    def open(self, url: str, *, headers: dict[str, str], timeout: float) -> Iterator[io.BytesIO]:
+        self.calls += 1
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        yield io.BytesIO(outcome)
+
+
+def _page(host: str) -> bytes:
+    return f"https://www.youtube.com/redirect?q=https%3A%2F%2F{host}%2F".encode()
+
+
+def _corrupt_truncated(data: bytearray) -> None:
+    data[-12:] = b"\xff" * 12
+
+
+def _corrupt_deflate(data: bytearray) -> None:
+    # Skip the 10-byte header and the stored file name, then mark the first
+    # deflate block with the reserved block type so zlib rejects it
+    start = data.index(0, 10) + 1 if data[3] & 0x08 else 10
+    data[start] |= 0x06
+
+
+class TestFetchRedirectUrls(unittest.TestCase):
+    url = "https://www.youtube.com/@x/about"
+
+    def _fetch(self, pool: _FakePool, **kwargs: object) -> tuple[list[str], mock.Mock]:
+        with mock.patch.object(scrape_links, "_CONNECTION_POOL", pool), \
+                mock.patch.object(scrape_links.time, "sleep") as sleep:
+            urls = scrape_links.fetch_redirect_urls(self.url, **kwargs)
+        return urls, sleep
+
+    def test_retries_server_errors(self) -> None:
+        pool = _FakePool([_http_error(503), _http_error(429), _page("e.example")])
+        urls, sleep = self._fetch(pool, max_retries=2)
+        self.assertEqual(urls, [_page("e.example").decode()])
+        self.assertEqual(pool.calls, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_honours_retry_after(self) -> None:
+        pool = _FakePool([_http_error(429, retry_after="120"), _page("e.example")])
+        _, sleep = self._fetch(pool, max_retries=1)
+        self.assertGreaterEqual(sleep.call_args[0][0], 120)
+
+    def test_raises_after_last_attempt(self) -> None:
+        pool = _FakePool([_http_error(429), _http_error(429)])
+        with self.assertRaises(urllib.error.HTTPError):
+            self._fetch(pool, max_retries=1)
+        self.assertEqual(pool.calls, 2)
+
+    def test_does_not_retry_client_errors(self) -> None:
+        pool = _FakePool([_http_error(404)])
+        with self.assertRaises(urllib.error.HTTPError):
+            self._fetch(pool, max_retries=2)
+        self.assertEqual(pool.calls, 1)
+
+    def test_replays_cached_page_and_counts_hit(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache = scrape_links.PageCache(directory)
+            pool = _FakePool([_page("e.example")])
+            first, _ = self._fetch(pool, use_proxy=False, cache=cache)
+            second, _ = self._fetch(pool, use_proxy=False, cache=cache)
+            self.assertEqual(first, second)
+            self.assertEqual(pool.calls, 1)
+            self.assertEqual(cache.hits, 1)
+
+    def test_refetches_corrupt_cache_entry(self) -> None:
+        for corrupt in (_corrupt_truncated, _corrupt_deflate):
+            with self.subTest(corrupt=corrupt.__name__), \
+                    tempfile.TemporaryDirectory() as directory:
+                cache = scrape_links.PageCache(directory)
+                with cache.writer(self.url) as write:
+                    write(_page("stale.example") * 50)
+                (entry,) = Path(directory).iterdir()
+                data = bytearray(entry.read_bytes())
+                corrupt(data)
+                entry.write_bytes(bytes(data))
+                pool = _FakePool([_page("fresh.example"), _page("unused.example")])
+                urls, _ = self._fetch(pool, use_proxy=False, cache=cache)
+                self.assertEqual(urls, [_page("fresh.example").decode()])
+                self.assertEqual(cache.hits, 0)
+                # The corrupt entry was replaced by the fresh page
+                self.assertEqual(self._fetch(pool, use_proxy=False, cache=cache)[0], urls)
+                self.assertEqual(pool.calls, 1)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if self.path == "/moved":
+            self._reply(302, b"", location="/page")
+        elif self.path == "/nowhere":
+            self._reply(302, b"")
+        elif self.path == "/page":
+            self._reply(200, f"port {self.client_address[1]}".encode())
+        else:
+            self._reply(404, b"missing")
+
+    def _reply(self, status: int, body: bytes, location: str | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        if location:
+            self.send_header("Location", location)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.pool = scrape_links.ConnectionPool()
+        patcher = mock.patch("urllib.request.getproxies", return_value={})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self.pool.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _get(self, path: str) -> bytes:
+        with self.pool.open(self.base + path, headers={}, timeout=5) as response:
+            return response.read()
+
+    def test_reuses_connection_and_follows_redirects(self) -> None:
+        first = self._get("/page")
+        self.assertEqual(self._get("/moved"), first)
+
+    def test_error_status_raises_http_error(self) -> None:
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self._get("/nope")
+        self.assertEqual(ctx.exception.code, 404)
+        self.assertTrue(self._get("/page").startswith(b"port "))
+
+    def test_redirect_without_location_raises_http_error(self) -> None:
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self._get("/nowhere")
+        self.assertEqual(ctx.exception.code, 302)
+
+    def test_close_drops_connections_and_reconnects(self) -> None:
+        first = self._get("/page")
+        self.pool.close()
+        self.assertNotEqual(self._get("/page"), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,10 +27,55 @@ class TestParseChannelLinks(unittest.TestCase):
         )
         self.assertEqual(scrape_links.parse_channel_links(page), ["https://same"])
 
+    def test_duplicate_keeps_highest_priority_position(self) -> None:
+        page = (
+            "https://www.youtube.com/redirect?event=channel_description&q=https%3A%2F%2Fsame "
+            "https://www.youtube.com/redirect?event=channel_description&q=https%3A%2F%2Fother "
+            "https://www.youtube.com/redirect?event=channel_header&q=https%3A%2F%2Fsame"
+        )
+        self.assertEqual(
+            scrape_links.parse_channel_links(page),
+            ["https://same", "https://other"],
+        )
+
     def test_skips_redirect_without_q(self) -> None:
         page = "https://www.youtube.com/redirect?event=channel_header"
         self.assertEqual(scrape_links.parse_channel_links(page), [])
 
+    def test_decodes_target_only_once(self) -> None:
+        page = (
+            "https://www.youtube.com/redirect?event=channel_header"
+            "&q=https%3A%2F%2Fexample.com%2Fsearch%3Fterm%3Da%2520b&v=abc"
+        )
+        self.assertEqual(
+            scrape_links.parse_channel_links(page),
+            ["https://example.com/search?term=a%20b"],
+        )
+
+    def test_decodes_plus_as_space(self) -> None:
+        page = "https://www.youtube.com/redirect?q=https%3A%2F%2Fe.example%2Fa+b"
+        self.assertEqual(scrape_links.parse_channel_links(page), ["https://e.example/a b"])
+
+    def test_reads_links_from_initial_data(self) -> None:
+        page = (
+            '<html><script>var ytInitialData = {"header": {"links": [{"urlEndpoint": {"url": '
+            '"https://www.youtube.com/redirect?event=channel_description\\u0026'
+            'redir_token=abc\\u0026q=https%3A%2F%2Flate.example"}}, {"urlEndpoint": {"url": '
+            '"https://www.youtube.com/redirect?event=channel_header\\u0026'
+            'q=https%3A%2F%2Ffirst.example"}}, {"url": "/watch?v=1"}]}};</script></html>'
+        )
+        self.assertEqual(
+            scrape_links.parse_channel_links(page),
+            ["https://first.example", "https://late.example"],
+        )
+
+    def test_accepts_raw_bytes_and_stops_at_non_ascii(self) -> None:
+        page = (
+            "Links:\u00a0https://www.youtube.com/redirect?event=channel_header"
+            "&q=https%3A%2F%2Fexample.com\u00a0caf\u00e9"
+        ).encode("utf-8")
+        self.assertEqual(scrape_links.parse_channel_links(page), ["https://example.com"])
+
     def test_handles_markdown_link_wrapping(self) -> None:
         page = "[text](https://www.youtube.com/redirect?event=channel_header&q=https%3A%2F%2Fexample.com)"
         self.assertEqual(scrape_links.parse_channel_links(page), ["https://example.com"])
@@ -41,6 +86,57 @@ class TestParseChannelLinks(unittest.TestCase):
         self.assertIn("https://example.com", links)
 
 
+class TestScanRedirectUrls(unittest.TestCase):
+    @staticmethod
+    def _chunks(page: bytes, size: int) -> list[bytes]:
+        return [page[i:i + size] for i in range(0, len(page), size)]
+
+    def test_chunk_boundaries_do_not_drop_or_duplicate(self) -> None:
+        page = "".join(
+            f"{'x' * (i * 37 % 500)} https://www.youtube.com/redirect?event=channel_header"
+            f"&q=https%3A%2F%2Fsite{i}.example\n"
+            for i in range(1000)
+        ).encode()
+        expected = scrape_links.scan_redirect_urls([page])
+        self.assertEqual(len(expected), 1000)
+        for size in (97, 4096, 5000, 65536):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    scrape_links.scan_redirect_urls(self._chunks(page, size)), expected
+                )
+
+    def test_chunked_initial_data_tokens(self) -> None:
+        page = ("var ytInitialData = {" + ",".join(
+            f'"l{i}":{{"url":"https://www.youtube.com/redirect?event=channel_header'
+            f'\\u0026q=https%3A%2F%2Fsite{i}.example","pad":"{"y" * (i * 53 % 700)}"}}'
+            for i in range(1000)
+        ) + "};</script>").encode()
+        expected = scrape_links.scan_redirect_urls([page])
+        self.assertEqual(len(expected), 1000)
+        self.assertTrue(expected[0].endswith("&q=https%3A%2F%2Fsite0.example"))
+        for size in (97, 4096, 5000, 65536):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    scrape_links.scan_redirect_urls(self._chunks(page, size)), expected
+                )
+
+
+class TestCompileUrlFilter(unittest.TestCase):
+    def test_no_filters_returns_none(self) -> None:
+        self.assertIsNone(scrape_links._compile_url_filter(None))
+        self.assertIsNone(scrape_links._compile_url_filter([]))
+
+    def test_matches_any_filter_case_insensitively(self) -> None:
+        pattern = scrape_links._compile_url_filter(["Patreon.com", "instagram.com"])
+        self.assertTrue(pattern.search("https://www.PATREON.com/x"))
+        self.assertTrue(pattern.search("https://instagram.com/x"))
+        self.assertIsNone(pattern.search("https://twitter.com/x"))
+
+    def test_escapes_regex_metacharacters(self) -> None:
+        pattern = scrape_links._compile_url_filter(["a.b"])
+        self.assertIsNone(pattern.search("https://axb.example"))
+
+
 class TestCategoriseLink(unittest.TestCase):
     def test_social_twitter(self) -> None:
         self.assertEqual(scrape_links.categorise_link("https://twitter.com/example"), "Social")
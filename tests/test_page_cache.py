@@ -0,0 +1,71 @@
+"""Tests for the on-disk About page cache."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import scrape_links
+
+
+def _put(cache: scrape_links.PageCache, url: str, page: bytes) -> None:
+    with cache.writer(url) as write:
+        write(page)
+
+
+def _read(cache: scrape_links.PageCache, url: str) -> bytes | None:
+    handle = cache.open(url)
+    if handle is None:
+        return None
+    with handle:
+        return handle.read()
+
+
+class TestPageCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name) / "cache"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_round_trips_page(self) -> None:
+        cache = scrape_links.PageCache(self.cache_dir)
+        _put(cache, "https://example.com/a", "page ☃ text".encode())
+        self.assertEqual(_read(cache, "https://example.com/a"), "page ☃ text".encode())
+
+    def test_miss_returns_none(self) -> None:
+        cache = scrape_links.PageCache(self.cache_dir)
+        self.assertIsNone(cache.open("https://example.com/missing"))
+
+    def test_expired_entry_is_deleted(self) -> None:
+        cache = scrape_links.PageCache(self.cache_dir, ttl_seconds=60)
+        _put(cache, "https://example.com/a", b"stale")
+        (entry,) = self.cache_dir.iterdir()
+        old = time.time() - 120
+        os.utime(entry, (old, old))
+        self.assertIsNone(cache.open("https://example.com/a"))
+        self.assertFalse(entry.exists())
+
+    def test_zero_ttl_never_expires(self) -> None:
+        cache = scrape_links.PageCache(self.cache_dir, ttl_seconds=0)
+        _put(cache, "https://example.com/a", b"kept")
+        (entry,) = self.cache_dir.iterdir()
+        os.utime(entry, (0, 0))
+        self.assertEqual(_read(cache, "https://example.com/a"), b"kept")
+
+    def test_writer_does_not_commit_on_error(self) -> None:
+        cache = scrape_links.PageCache(self.cache_dir)
+        with self.assertRaises(RuntimeError):
+            with cache.writer("https://example.com/a") as write:
+                write(b"partial")
+                raise RuntimeError
+        self.assertIsNone(cache.open("https://example.com/a"))
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,241 @@
+"""Tests for the concurrent channel scraping loop."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import json
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+from pathlib import Path
+from unittest import mock
+
+import scrape_links
+
+
+def _subscriptions(count: int) -> list[scrape_links.Subscription]:
+    return [
+        scrape_links.Subscription(f"Channel {i}", f"https://www.youtube.com/@channel{i}")
+        for i in range(count)
+    ]
+
+
+def _fake_fetch(failing: dict[str, Exception]):
+    def fetch(about_url: str, **kwargs: object) -> list[str]:
+        for marker, exc in failing.items():
+            if marker in about_url:
+                raise exc
+        name = about_url.split("/@")[1].split("/")[0]
+        return [f"https://www.youtube.com/redirect?q=https%3A%2F%2F{name}.example%2F"]
+    return fetch
+
+
+class TestScrapeLinksAsync(unittest.TestCase):
+    def _scrape(self, subscriptions, fetch, **kwargs: object) -> list[dict[str, object]]:
+        kwargs.setdefault("workers", 4)
+        with mock.patch.object(scrape_links, "fetch_redirect_urls", fetch):
+            return scrape_links._run_async(scrape_links.scrape_links_async(
+                subscriptions, progress=False, batch_delay=0, **kwargs,
+            ))
+
+    def test_failing_channel_reports_error_and_others_complete(self) -> None:
+        errors: list[tuple[str, str]] = []
+        failing = {
+            "@channel1/": urllib.error.HTTPError("u", 404, "Not Found", None, None),
+            "@channel3/": TimeoutError("timed out"),
+        }
+        results = self._scrape(_subscriptions(5), _fake_fetch(failing),
+                               on_error=lambda title, err: errors.append((title, err)))
+        self.assertEqual([r["channel_title"] for r in results],
+                         ["Channel 0", "Channel 2", "Channel 4"])
+        self.assertEqual(sorted(errors),
+                         [("Channel 1", "HTTP 404"), ("Channel 3", "timed out")])
+
+    def test_unexpected_exception_is_isolated(self) -> None:
+        errors: list[tuple[str, str]] = []
+        results = self._scrape(_subscriptions(3), _fake_fetch({"@channel0/": ValueError("bad")}),
+                               on_error=lambda title, err: errors.append((title, err)))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(errors, [("Channel 0", "bad")])
+
+    def test_keeps_at_most_workers_fetches_in_flight(self) -> None:
+        lock = threading.Lock()
+        in_flight = peak = 0
+        fetch = _fake_fetch({})
+
+        def slow_fetch(about_url: str, **kwargs: object) -> list[str]:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return fetch(about_url)
+
+        results = self._scrape(_subscriptions(8), slow_fetch, workers=3)
+        self.assertEqual(len(results), 8)
+        self.assertEqual(peak, 3)
+
+    def test_results_follow_csv_order(self) -> None:
+        fetch = _fake_fetch({})
+
+        def reversed_fetch(about_url: str, **kwargs: object) -> list[str]:
+            index = int(about_url.split("@channel")[1].split("/")[0])
+            time.sleep(0.01 * (5 - index))
+            return fetch(about_url)
+
+        results = self._scrape(_subscriptions(5), reversed_fetch, workers=5)
+        self.assertEqual([r["channel_title"] for r in results],
+                         [f"Channel {i}" for i in range(5)])
+
+    def test_resume_skips_already_scraped_titles(self) -> None:
+        calls: list[str] = []
+        fetch = _fake_fetch({})
+
+        def recording_fetch(about_url: str, **kwargs: object) -> list[str]:
+            calls.append(about_url)
+            return fetch(about_url)
+
+        results = self._scrape(_subscriptions(3), recording_fetch,
+                               resume_from={"Channel 0", "Channel 2"})
+        self.assertEqual([r["channel_title"] for r in results], ["Channel 1"])
+        self.assertEqual(len(calls), 1)
+
+    def test_cancel_returns_collected_results(self) -> None:
+        updates: list[dict[str, object]] = []
+
+        async def run() -> list[dict[str, object]]:
+            task = asyncio.create_task(scrape_links.scrape_links_async(
+                _subscriptions(3), progress=False, batch_size=1, batch_delay=60,
+                on_update=updates.append,
+            ))
+            while not updates:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            return await task
+
+        with mock.patch.object(scrape_links, "fetch_redirect_urls", _fake_fetch({})):
+            results = scrape_links._run_async(run())
+        self.assertEqual([r["channel_title"] for r in results], ["Channel 0"])
+
+    def test_skips_batch_delay_when_batch_was_cached(self) -> None:
+        page = b"https://www.youtube.com/redirect?q=https%3A%2F%2Fe.example%2F"
+        pool = mock.Mock()
+        pool.open.side_effect = lambda *args, **kwargs: contextlib.nullcontext(io.BytesIO(page))
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.object(scrape_links, "_CONNECTION_POOL", pool), \
+                mock.patch.object(scrape_links.asyncio, "sleep", mock.AsyncMock()) as sleep:
+            cache = scrape_links.PageCache(directory)
+            for expected_sleeps in (2, 0):
+                sleep.reset_mock()
+                results = scrape_links._run_async(scrape_links.scrape_links_async(
+                    _subscriptions(3), progress=False, use_proxy=False, cache=cache,
+                    batch_size=1, batch_delay=60,
+                ))
+                self.assertEqual(len(results), 3)
+                self.assertEqual(sleep.await_count, expected_sleeps)
+        self.assertEqual(pool.open.call_count, 3)
+
+
+class TestScrapeLinks(unittest.TestCase):
+    def test_sequential_run_uses_async_loop(self) -> None:
+        with mock.patch.object(scrape_links, "fetch_redirect_urls", _fake_fetch({})):
+            results = scrape_links.scrape_links(_subscriptions(2), progress=False,
+                                                batch_delay=0)
+        self.assertEqual([r["links"] for r in results], [
+            ["https://channel0.example/"], ["https://channel1.example/"],
+        ])
+
+
+class TestMainCheckpoint(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = Path(tmp.name)
+        self.csv_path = self.directory / "subscriptions.csv"
+        self.csv_path.write_text("Channel Url,Channel Title\n" + "".join(
+            f"https://www.youtube.com/@channel{i},Channel {i}\n" for i in range(3)
+        ), encoding="utf-8")
+        self.output_path = self.directory / "links.json"
+        self.fetched: list[str] = []
+        self.run = 0
+        fetch = _fake_fetch({})
+
+        def recording_fetch(about_url: str, **kwargs: object) -> list[str]:
+            self.fetched.append(about_url)
+            return fetch(about_url) + [
+                f"https://www.youtube.com/redirect?q=https%3A%2F%2Frun{self.run}.example%2F"
+            ]
+
+        patcher = mock.patch.object(scrape_links, "fetch_redirect_urls", recording_fetch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _main(self, *extra: str) -> int:
+        argv = [str(self.csv_path), "-o", str(self.output_path), "--no-progress", "--batch-delay", "0", *extra]
+        self.run += 1
+        with contextlib.redirect_stdout(io.StringIO()):
+            return scrape_links.main(argv)
+
+    def _titles(self) -> list[str]:
+        data = json.loads(self.output_path.read_text(encoding="utf-8"))
+        return sorted(entry["channel_title"] for entry in data)
+
+    def test_removes_checkpoint_after_complete_run(self) -> None:
+        self.assertEqual(self._main(), 0)
+        self.assertEqual(self._titles(), ["Channel 0", "Channel 1", "Channel 2"])
+        self.assertFalse(self.output_path.with_suffix(".jsonl").exists())
+
+    def test_consecutive_resume_runs_refresh_links(self) -> None:
+        for run in (1, 2):
+            self.assertEqual(self._main("--resume"), 0)
+            data = json.loads(self.output_path.read_text(encoding="utf-8"))
+            self.assertEqual(len(data), 3)
+            for entry in data:
+                self.assertIn(f"https://run{run}.example/", entry["links"])
+        self.assertEqual(len(self.fetched), 6)
+        self.assertFalse(self.output_path.with_suffix(".jsonl").exists())
+
+    def test_resume_recovers_checkpointed_channels(self) -> None:
+        checkpoint = {"channel_title": "Channel 1", "channel_url": "u",
+                      "links": ["https://kept.example/"], "categories": [None]}
+        self.output_path.with_suffix(".jsonl").write_text(
+            json.dumps(checkpoint) + "\n", encoding="utf-8")
+        self.assertEqual(self._main("--resume"), 0)
+        self.assertEqual(len(self.fetched), 2)
+        self.assertNotIn("@channel1/", "".join(self.fetched))
+        self.assertEqual(self._titles(), ["Channel 0", "Channel 1", "Channel 2"])
+
+    def test_previous_output_kept_until_final_write(self) -> None:
+        self.output_path.write_text('[{"channel_title": "Old"}]', encoding="utf-8")
+        seen: list[str] = []
+        fetch = _fake_fetch({})
+
+        def peeking_fetch(about_url: str, **kwargs: object) -> list[str]:
+            seen.append(self.output_path.read_text(encoding="utf-8"))
+            return fetch(about_url)
+
+        with mock.patch.object(scrape_links, "fetch_redirect_urls", peeking_fetch):
+            self.assertEqual(self._main(), 0)
+        self.assertEqual(set(seen), {'[{"channel_title": "Old"}]'})
+        self.assertEqual(self._titles(), ["Channel 0", "Channel 1", "Channel 2"])
+
+    def test_cache_is_opt_in(self) -> None:
+        with mock.patch.object(scrape_links, "PageCache") as page_cache:
+            self._main()
+            page_cache.assert_not_called()
+            self._main("--cache-ttl", "60")
+            page_cache.assert_called_once_with(scrape_links.DEFAULT_CACHE_DIR, 60.0)
+
+    def test_no_checkpoint_skips_file(self) -> None:
+        self.assertEqual(self._main("--no-checkpoint"), 0)
+        self.assertFalse(self.output_path.with_suffix(".jsonl").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
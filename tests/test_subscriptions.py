@@ -75,6 +75,20 @@ class TestSubscriptionReader(unittest.TestCase):
         finally:
             Path(tmp).unlink()
 
+    def test_ignores_blank_lines(self) -> None:
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", encoding="utf-8", delete=False
+        ) as f:
+            f.write("Channel Id,Channel Url,Channel Title\n\n")
+            f.write("UCabc,https://youtube.com/@Good,Good Channel\n\n")
+            tmp = f.name
+        try:
+            reader = scrape_links.SubscriptionReader(tmp)
+            self.assertEqual(len(reader.read()), 1)
+            self.assertEqual(reader.skipped_count, 0)
+        finally:
+            Path(tmp).unlink()
+
     def test_handles_different_column_names(self) -> None:
         with tempfile.NamedTemporaryFile(
             "w", suffix=".csv", encoding="utf-8", delete=False
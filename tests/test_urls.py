@@ -58,6 +58,34 @@ class TestNormaliseChannelUrl(unittest.TestCase):
             "https://www.youtube.com/channel/UCabc",
         )
 
+    def test_canonical_channel_url_fast_path(self) -> None:
+        self.assertEqual(
+            scrape_links.normalise_channel_url(
+                "http://www.youtube.com/channel/UCZUT79WUUpZlZ-XMF7l4CFg/"
+            ),
+            "https://www.youtube.com/channel/UCZUT79WUUpZlZ-XMF7l4CFg",
+        )
+
+    def test_fast_path_matches_slow_path(self) -> None:
+        for url in (
+            "https://youtube.com/@Example",
+            "https://www.youtube.com/c/SomeName",
+            "https://www.youtube.com/user/legacyname/",
+            "https://www.youtube.com/channel/UCZUT79WUUpZlZ-XMF7l4CFg",
+        ):
+            for channel_id in (None, "UCabc"):
+                with self.subTest(url=url, channel_id=channel_id):
+                    self.assertEqual(
+                        scrape_links.normalise_channel_url(url, channel_id),
+                        scrape_links.normalise_channel_url(url + "?si=x", channel_id),
+                    )
+
+    def test_custom_url_path_params_take_slow_path(self) -> None:
+        self.assertEqual(
+            scrape_links.normalise_channel_url("https://www.youtube.com/c/SomeName;x=1"),
+            "https://www.youtube.com/c/SomeName",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()